@@ -2,21 +2,36 @@
 __docformat__ = "numpy"
 import argparse
 import functools
+import itertools
 import logging
-from typing import List
+import math
+from collections.abc import Mapping
+from typing import List, Optional
 from datetime import datetime, timedelta, time as Time
 import os
 import random
 import re
 import sys
+import time
+import weakref
+import numpy as np
 import pandas as pd
 from pytz import timezone
 import iso8601
 
+try:
+    from ciso8601 import parse_datetime as iso_parse_date
+except ImportError:
+    iso_parse_date = iso8601.parse_date
+
 import matplotlib
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Rectangle
 from holidays import US as us_holidays
 from colorama import Fore, Style
+from dateutil.easter import easter
 from pandas._config.config import get_option
 from pandas.plotting import register_matplotlib_converters
 import pandas.io.formats.format
@@ -42,6 +57,56 @@ MENU_GO_BACK = 0
 MENU_QUIT = 1
 MENU_RESET = 2
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_WEB_ADDRESS_RE = re.compile(r"(?i)http(s):\/\/[a-z0-9.~_\-\/]+")
+_USER_RE = re.compile(r"(?i)@[a-z0-9_]+")
+_ANSI_RE = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+# Matches strings containing at least two letters
+_TWO_LETTERS_RE = re.compile(r"[^\W\d_].*[^\W\d_]", re.DOTALL)
+_OHLCA_TABLE = str.maketrans("ohlca", "12345")
+_BOOL_MAP = {
+    **dict.fromkeys(("false", "f", "0", "no", "n"), False),
+    **dict.fromkeys(("true", "t", "1", "yes", "y"), True),
+}
+
+
+def _validate_int(
+    value,
+    mini: Optional[int] = None,
+    maxi: Optional[int] = None,
+    error: str = "{value} is not a valid int value",
+) -> int:
+    """
+    Checks if value is an int between optional bounds
+
+    Parameters
+    ----------
+    value:
+        Value to convert to int
+    mini: int
+        Min value allowed, no lower bound if None
+    maxi: int
+        Max value allowed, no upper bound if None
+    error: str
+        Error message, formatted with value, mini and maxi when the check fails
+
+    Returns
+    -------
+    num: int
+        Input number if conditions are met
+
+    Raises
+    -------
+    argparse.ArgumentTypeError
+        Input number not between min and max values
+    """
+    num = int(value)
+    if (mini is not None and num < mini) or (maxi is not None and num > maxi):
+        raise argparse.ArgumentTypeError(
+            error.format(value=value, mini=mini, maxi=maxi)
+        )
+    return num
+
 
 def check_int_range(mini: int, maxi: int):
     """
@@ -80,10 +145,7 @@ def check_int_range(mini: int, maxi: int):
         argparse.ArgumentTypeError
             Input number not between min and max values
         """
-        num = int(num)
-        if num < mini or num > maxi:
-            raise argparse.ArgumentTypeError(f"must be in range [{mini},{maxi}]")
-        return num
+        return _validate_int(num, mini, maxi, "must be in range [{mini},{maxi}]")
 
     # Return function handle to checking function
     return int_range_checker
@@ -91,10 +153,7 @@ def check_int_range(mini: int, maxi: int):
 
 def check_non_negative(value) -> int:
     """Argparse type to check non negative int"""
-    new_value = int(value)
-    if new_value < 0:
-        raise argparse.ArgumentTypeError(f"{value} is negative")
-    return new_value
+    return _validate_int(value, mini=0, error="{value} is negative")
 
 
 def check_non_negative_float(value) -> float:
@@ -121,10 +180,9 @@ def check_positive_list(value) -> List[int]:
 
 def check_positive(value) -> int:
     """Argparse type to check positive int"""
-    new_value = int(value)
-    if new_value <= 0:
-        raise argparse.ArgumentTypeError(f"{value} is an invalid positive int value")
-    return new_value
+    return _validate_int(
+        value, mini=1, error="{value} is an invalid positive int value"
+    )
 
 
 def check_positive_float(value) -> float:
@@ -163,6 +221,16 @@ def check_proportion_range(num) -> float:
 def valid_date(s: str) -> datetime:
     """Argparse type to check date is in valid format"""
     try:
+        # Parse zero padded dates directly since it is much faster than strptime
+        digits = s[:4] + s[5:7] + s[8:10]
+        if (
+            len(s) == 10
+            and s[4] == "-"
+            and s[7] == "-"
+            and digits.isascii()
+            and digits.isdigit()
+        ):
+            return datetime(int(s[:4]), int(s[5:7]), int(s[8:10]))
         return datetime.strptime(s, "%Y-%m-%d")
     except ValueError as value_error:
         raise argparse.ArgumentTypeError(f"Not a valid date: {s}") from value_error
@@ -182,7 +250,7 @@ def plot_view_stock(df: pd.DataFrame, symbol: str, interval: str):
 
     """
     df.sort_index(ascending=True, inplace=True)
-    bar_colors = ["r" if x[1].Open < x[1].Close else "g" for x in df.iterrows()]
+    bar_colors = np.where(df["Open"].values < df["Close"].values, "r", "g")
 
     try:
         fig, ax = plt.subplots(
@@ -221,9 +289,21 @@ def plot_view_stock(df: pd.DataFrame, symbol: str, interval: str):
 
     ax[0].spines["top"].set_visible(False)
     ax[0].spines["left"].set_visible(False)
-    ax[1].bar(
-        df.index, df.Volume / 1_000_000, color=bar_colors, alpha=0.8, width=bar_width
+    # Draw the volume as a single collection instead of one artist per bar
+    width = bar_width / timedelta(days=1)
+    x_left = mdates.date2num(df.index.to_pydatetime()) - width / 2
+    volume = df.Volume.values / 1_000_000
+    ax[1].add_collection(
+        PatchCollection(
+            [Rectangle((x, 0), width, v) for x, v in zip(x_left, volume)],
+            facecolor=bar_colors,
+            edgecolor="none",
+            alpha=0.8,
+        )
     )
+    ax[1].xaxis_date()
+    ax[1].autoscale_view()
+    ax[1].set_ylim(bottom=0)
     ax[1].set_xlim(df.index[0], df.index[-1])
     ax[1].yaxis.tick_right()
     ax[1].yaxis.set_label_position("right")
@@ -249,12 +329,48 @@ def plot_view_stock(df: pd.DataFrame, symbol: str, interval: str):
     print("")
 
 
-def us_market_holidays(years) -> list:
-    """Get US market holidays"""
+#   http://www.maa.clell.de/StarDate/publ_holidays.html
+GOOD_FRIDAYS = {
+    2010: "2010-04-02",
+    2011: "2011-04-22",
+    2012: "2012-04-06",
+    2013: "2013-03-29",
+    2014: "2014-04-18",
+    2015: "2015-04-03",
+    2016: "2016-03-25",
+    2017: "2017-04-14",
+    2018: "2018-03-30",
+    2019: "2019-04-19",
+    2020: "2020-04-10",
+    2021: "2021-04-02",
+    2022: "2022-04-15",
+    2023: "2023-04-07",
+    2024: "2024-03-29",
+    2025: "2025-04-18",
+    2026: "2026-04-03",
+    2027: "2027-03-26",
+    2028: "2028-04-14",
+    2029: "2029-03-30",
+    2030: "2030-04-19",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def us_market_holidays(years) -> tuple:
+    """Get US market holidays
+
+    Parameters
+    ----------
+    years: int or tuple of int
+        Year(s) to get the market holidays for. Must be hashable since results are cached
+
+    Returns
+    -------
+    tuple
+        Dates of the US market holidays
+    """
     if isinstance(years, int):
-        years = [
-            years,
-        ]
+        years = (years,)
     # https://www.nyse.com/markets/hours-calendars
     market_holidays = [
         "Martin Luther King Jr. Day",
@@ -265,30 +381,6 @@ def us_market_holidays(years) -> list:
         "Thanksgiving",
         "Christmas Day",
     ]
-    #   http://www.maa.clell.de/StarDate/publ_holidays.html
-    good_fridays = {
-        2010: "2010-04-02",
-        2011: "2011-04-22",
-        2012: "2012-04-06",
-        2013: "2013-03-29",
-        2014: "2014-04-18",
-        2015: "2015-04-03",
-        2016: "2016-03-25",
-        2017: "2017-04-14",
-        2018: "2018-03-30",
-        2019: "2019-04-19",
-        2020: "2020-04-10",
-        2021: "2021-04-02",
-        2022: "2022-04-15",
-        2023: "2023-04-07",
-        2024: "2024-03-29",
-        2025: "2025-04-18",
-        2026: "2026-04-03",
-        2027: "2027-03-26",
-        2028: "2028-04-14",
-        2029: "2029-03-30",
-        2030: "2030-04-19",
-    }
     market_and_observed_holidays = market_holidays + [
         holiday + " (Observed)" for holiday in market_holidays
     ]
@@ -304,8 +396,38 @@ def us_market_holidays(years) -> list:
         if new_Year.weekday() == 6:  # add monday for Sunday
             valid_holidays.append(new_Year.date() + timedelta(1))
     for year in years:
-        valid_holidays.append(datetime.strptime(good_fridays[year], "%Y-%m-%d").date())
-    return valid_holidays
+        if year in GOOD_FRIDAYS:
+            good_friday = datetime.strptime(GOOD_FRIDAYS[year], "%Y-%m-%d").date()
+        else:
+            good_friday = easter(year) - timedelta(days=2)
+        valid_holidays.append(good_friday)
+    return tuple(valid_holidays)
+
+
+@functools.lru_cache(maxsize=1)
+def all_market_holidays() -> frozenset:
+    """Get US market holidays of every year in GOOD_FRIDAYS, computed on first use"""
+    return frozenset(us_market_holidays(tuple(GOOD_FRIDAYS)))
+
+
+@functools.lru_cache(maxsize=8)
+def market_busday_calendar(first_year: int, last_year: int) -> np.busdaycalendar:
+    """Get a numpy business day calendar skipping weekends and US market holidays
+    between first_year and last_year"""
+    holidays = set(all_market_holidays())
+    extra_years = tuple(
+        year for year in range(first_year, last_year + 1) if year not in GOOD_FRIDAYS
+    )
+    if extra_years:
+        holidays.update(us_market_holidays(extra_years))
+    return np.busdaycalendar(holidays=sorted(holidays))
+
+
+def is_market_holiday(day) -> bool:
+    """Checks if a date is a US market holiday"""
+    if day.year in GOOD_FRIDAYS:
+        return day in all_market_holidays()
+    return day in us_market_holidays(day.year)
 
 
 def b_is_stock_market_open() -> bool:
@@ -316,7 +438,7 @@ def b_is_stock_market_open() -> bool:
     if now.date().weekday() > 4:
         return False
     # Check if it is a holiday
-    if now.strftime("%Y-%m-%d") in us_market_holidays(now.year):
+    if is_market_holiday(now.date()):
         return False
     # Check if it hasn't open already
     if now.time() < Time(hour=9, minute=30, second=0):
@@ -330,25 +452,18 @@ def b_is_stock_market_open() -> bool:
 
 def long_number_format(num) -> str:
     """Format a long number"""
-    if isinstance(num, float):
-        magnitude = 0
-        while abs(num) >= 1000:
-            magnitude += 1
-            num /= 1000.0
-        num_str = int(num) if num.is_integer() else f"{num:.3f}"
-        return f"{num_str} {' KMBTP'[magnitude]}".strip()
     if isinstance(num, int):
         num = str(num)
-    if num.lstrip("-").isdigit():
-        num = int(num)
-        num /= 1.0
-        magnitude = 0
-        while abs(num) >= 1000:
-            magnitude += 1
-            num /= 1000.0
-        num_str = int(num) if num.is_integer() else f"{num:.3f}"
-        return f"{num_str} {' KMBTP'[magnitude]}".strip()
-    return num
+    if not isinstance(num, float):
+        if not num.lstrip("-").isdigit():
+            return num
+        num = float(num)
+    magnitude = 0
+    if abs(num) >= 1000:
+        magnitude = min(5, int(math.log10(abs(num)) // 3))
+        num /= 1000.0 ** magnitude
+    num_str = int(num) if num.is_integer() else f"{num:.3f}"
+    return f"{num_str} {' KMBTP'[magnitude]}".strip()
 
 
 def clean_data_values_to_float(val: str) -> float:
@@ -370,6 +485,30 @@ def clean_data_values_to_float(val: str) -> float:
     return float(val)
 
 
+def clean_data_values_to_float_series(values: pd.Series) -> pd.Series:
+    """Cleans a series of data to float based on string ending
+
+    Vectorized version of clean_data_values_to_float, values that
+    cannot be parsed become NaN
+
+    Parameters
+    ----------
+    values: pd.Series
+        Series of strings to clean
+
+    Returns
+    -------
+    pd.Series
+        Series of floats
+    """
+    # Remove any leading or trailing parentheses and spaces
+    values = values.str.strip("( )").replace("-", "0")
+    suffix = values.str[-1]
+    multiplier = suffix.map({"%": 1e-2, "K": 1e3, "M": 1e6, "B": 1e9})
+    values = values.where(multiplier.isna(), values.str[:-1])
+    return pd.to_numeric(values, errors="coerce") * multiplier.fillna(1.0)
+
+
 def int_or_round_float(x) -> str:
     """Format int or round float"""
     if (x - int(x) < -sys.float_info.epsilon) or (x - int(x) > sys.float_info.epsilon):
@@ -379,35 +518,56 @@ def int_or_round_float(x) -> str:
 
 
 def divide_chunks(data, n):
-    """Split into chunks"""
-    # looping till length of data
-    for i in range(0, len(data), n):
-        yield data[i : i + n]
+    """Split into chunks
+
+    Objects supporting len() and slicing, such as lists, strings, numpy arrays
+    and pandas objects, are sliced. Chunks of numpy arrays are views of the
+    original data and must not be mutated. Any other iterable is consumed
+    lazily and yielded as lists
+    """
+    if (
+        hasattr(data, "__len__")
+        and hasattr(data, "__getitem__")
+        and not isinstance(data, Mapping)
+    ):
+        # looping till length of data
+        for i in range(0, len(data), n):
+            yield data[i : i + n]
+        return
+
+    iterator = iter(data)
+    chunk = list(itertools.islice(iterator, n))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, n))
 
 
 def get_next_stock_market_days(last_stock_day, n_next_days) -> list:
     """Gets the next stock market day. Checks against weekends and holidays"""
-    n_days = 0
-    l_pred_days = []
-    years: list = []
-    holidays: list = []
-    while n_days < n_next_days:
-        last_stock_day += timedelta(hours=24)
-        year = last_stock_day.date().year
-        if year not in years:
-            years.append(year)
-            holidays += us_market_holidays(year)
-        # Check if it is a weekend
-        if last_stock_day.date().weekday() > 4:
-            continue
-        # Check if it is a holiday
-        if last_stock_day.strftime("%Y-%m-%d") in holidays:
-            continue
-        # Otherwise stock market is open
-        n_days += 1
-        l_pred_days.append(last_stock_day)
-
-    return l_pred_days
+    if n_next_days < 1:
+        return []
+
+    start = np.datetime64(last_stock_day.date(), "D")
+    first_year = min(last_stock_day.year, min(GOOD_FRIDAYS))
+    last_year = max(last_stock_day.year, max(GOOD_FRIDAYS))
+    while True:
+        # Rolling backward makes offset 1 the first open day after the start
+        open_days = np.busday_offset(
+            start,
+            np.arange(1, n_next_days + 1),
+            roll="backward",
+            busdaycal=market_busday_calendar(first_year, last_year),
+        )
+        end_year = open_days[-1].astype(object).year
+        # Load the holidays of the years that were reached as well
+        if end_year <= last_year:
+            break
+        last_year = end_year
+
+    return [
+        last_stock_day + timedelta(days=int(n_days))
+        for n_days in (open_days - start).astype(int)
+    ]
 
 
 def get_data(tweet):
@@ -415,25 +575,24 @@ def get_data(tweet):
     if "+" in tweet["created_at"]:
         s_datetime = tweet["created_at"].split(" +")[0]
     else:
-        s_datetime = iso8601.parse_date(tweet["created_at"]).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        s_datetime = iso_parse_date(tweet["created_at"]).strftime("%Y-%m-%d %H:%M:%S")
 
-    s_text = tweet["full_text"] if "full_text" in tweet.keys() else tweet["text"]
+    s_text = tweet["full_text"] if "full_text" in tweet else tweet["text"]
     return {"created_at": s_datetime, "text": s_text}
 
 
+@functools.lru_cache(maxsize=256)
+def _ticker_regex(s_ticker: str):
+    """Compile the regex matching a ticker mention"""
+    return re.compile(fr"(?i)@{s_ticker}(?=\b)")
+
+
 def clean_tweet(tweet: str, s_ticker: str) -> str:
     """Cleans tweets to be fed to sentiment model"""
-    whitespace = re.compile(r"\s+")
-    web_address = re.compile(r"(?i)http(s):\/\/[a-z0-9.~_\-\/]+")
-    ticker = re.compile(fr"(?i)@{s_ticker}(?=\b)")
-    user = re.compile(r"(?i)@[a-z0-9_]+")
-
-    tweet = whitespace.sub(" ", tweet)
-    tweet = web_address.sub("", tweet)
-    tweet = ticker.sub(s_ticker, tweet)
-    tweet = user.sub("", tweet)
+    tweet = _WHITESPACE_RE.sub(" ", tweet)
+    tweet = _WEB_ADDRESS_RE.sub("", tweet)
+    tweet = _ticker_regex(s_ticker).sub(s_ticker, tweet)
+    tweet = _USER_RE.sub("", tweet)
 
     return tweet
 
@@ -455,7 +614,7 @@ def get_user_agent() -> str:
 
 def text_adjustment_init(self):
     """Adjust text monkey patch for Pandas"""
-    self.ansi_regx = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+    self.ansi_regx = _ANSI_RE
     self.encoding = get_option("display.encoding")
 
 
@@ -527,6 +686,23 @@ def patch_pandas_text_adjustment():
     pandas.io.formats.format.TextAdjustment.adjoin = text_adjustment_adjoin
 
 
+EXPORT_ARGUMENTS = {
+    EXPORT_ONLY_RAW_DATA_ALLOWED: (
+        ["csv", "json", "xlsx"],
+        "Export raw data into csv, json, xlsx",
+    ),
+    EXPORT_ONLY_FIGURES_ALLOWED: (
+        ["png", "jpg", "pdf", "svg"],
+        "Export figure into png, jpg, pdf, svg ",
+    ),
+    EXPORT_BOTH_RAW_DATA_AND_FIGURES: (
+        ["csv", "json", "xlsx", "png", "jpg", "pdf", "svg"],
+        "Export raw data into csv, json, xlsx and figure into png, jpg, pdf, svg ",
+    ),
+}
+_AUGMENTED_PARSERS: "weakref.WeakSet[argparse.ArgumentParser]" = weakref.WeakSet()
+
+
 def parse_known_args_and_warn(
     parser: argparse.ArgumentParser,
     other_args: List[str],
@@ -549,31 +725,22 @@ def parse_known_args_and_warn(
     ns_parser:
         Namespace with parsed arguments
     """
-    parser.add_argument(
-        "-h", "--help", action="store_true", help="show this help message"
-    )
-    if export_allowed > NO_EXPORT:
-        choices_export = []
-        help_export = "Does not export!"
-
-        if export_allowed == EXPORT_ONLY_RAW_DATA_ALLOWED:
-            choices_export = ["csv", "json", "xlsx"]
-            help_export = "Export raw data into csv, json, xlsx"
-        elif export_allowed == EXPORT_ONLY_FIGURES_ALLOWED:
-            choices_export = ["png", "jpg", "pdf", "svg"]
-            help_export = "Export figure into png, jpg, pdf, svg "
-        else:
-            choices_export = ["csv", "json", "xlsx", "png", "jpg", "pdf", "svg"]
-            help_export = "Export raw data into csv, json, xlsx and figure into png, jpg, pdf, svg "
-
+    # Parsers may be reused, only add the common arguments once
+    if parser not in _AUGMENTED_PARSERS:
         parser.add_argument(
-            "--export",
-            choices=choices_export,
-            default="",
-            type=str,
-            dest="export",
-            help=help_export,
+            "-h", "--help", action="store_true", help="show this help message"
         )
+        if export_allowed > NO_EXPORT:
+            choices_export, help_export = EXPORT_ARGUMENTS[export_allowed]
+            parser.add_argument(
+                "--export",
+                choices=choices_export,
+                default="",
+                type=str,
+                dest="export",
+                help=help_export,
+            )
+        _AUGMENTED_PARSERS.add(parser)
 
     if gtff.USE_CLEAR_AFTER_CMD:
         system_clear()
@@ -600,7 +767,7 @@ def financials_colored_values(val: str) -> str:
     """Add a color to a value"""
     if val == "N/A" or str(val) == "nan":
         val = f"{Fore.YELLOW}N/A{Style.RESET_ALL}"
-    elif sum(c.isalpha() for c in val) < 2:
+    elif not _TWO_LETTERS_RE.search(val):
         if "%" in val and "-" in val or "%" not in val and "(" in val:
             val = f"{Fore.RED}{val}{Style.RESET_ALL}"
         elif "%" in val:
@@ -608,6 +775,36 @@ def financials_colored_values(val: str) -> str:
     return val
 
 
+def financials_colored_values_series(values: pd.Series) -> pd.Series:
+    """Add a color to each value of a series
+
+    Vectorized version of financials_colored_values
+
+    Parameters
+    ----------
+    values: pd.Series
+        Series of values to color
+
+    Returns
+    -------
+    pd.Series
+        Series of colored values
+    """
+    text = values.astype(str)
+    is_na = values.isna() | (text == "N/A") | (text == "nan")
+    has_pct = text.str.contains("%", regex=False)
+    has_minus = text.str.contains("-", regex=False)
+    has_paren = text.str.contains("(", regex=False)
+    # Only color values that are not mostly made of letters
+    colorable = ~text.str.contains(_TWO_LETTERS_RE)
+    red = colorable & ((has_pct & has_minus) | (~has_pct & has_paren))
+    green = colorable & ~red & has_pct
+
+    colored = values.where(~red, Fore.RED + text + Style.RESET_ALL)
+    colored = colored.where(~green, Fore.GREEN + text + Style.RESET_ALL)
+    return colored.mask(is_na, f"{Fore.YELLOW}N/A{Style.RESET_ALL}")
+
+
 def check_ohlc(type_ohlc: str) -> str:
     """Check that data is in ohlc"""
     if bool(re.match("^[ohlca]+$", type_ohlc)):
@@ -617,10 +814,7 @@ def check_ohlc(type_ohlc: str) -> str:
 
 def lett_to_num(word: str) -> str:
     """Matches ohlca to integers"""
-    replacements = [("o", "1"), ("h", "2"), ("l", "3"), ("c", "4"), ("a", "5")]
-    for (a, b) in replacements:
-        word = word.replace(a, b)
-    return word
+    return word.translate(_OHLCA_TABLE)
 
 
 def get_flair() -> str:
@@ -659,15 +853,19 @@ def str_to_bool(value) -> bool:
     """Match a string to a boolean value"""
     if isinstance(value, bool):
         return value
-    if value.lower() in {"false", "f", "0", "no", "n"}:
-        return False
-    if value.lower() in {"true", "t", "1", "yes", "y"}:
-        return True
-    raise ValueError(f"{value} is not a valid boolean value")
+    result = _BOOL_MAP.get(value.lower())
+    if result is None:
+        raise ValueError(f"{value} is not a valid boolean value")
+    return result
 
 
+@functools.lru_cache(maxsize=1)
 def get_screeninfo():
-    """Get screeninfo"""
+    """Get screeninfo
+
+    The screen size is queried once and cached, call get_screeninfo.cache_clear()
+    after plugging or unplugging monitors to detect them again
+    """
     screens = get_monitors()  # Get all available monitors
     if len(screens) - 1 < cfgPlot.MONITOR:  # Check to see if chosen monitor is detected
         monitor = 0
@@ -698,34 +896,41 @@ def plot_autoscale():
 
 def get_last_time_market_was_open(dt):
     """Get last time the US market was open"""
-    # Check if it is a weekend
-    if dt.date().weekday() > 4:
-        dt = get_last_time_market_was_open(dt - timedelta(hours=24))
+    # Walk back while it is a weekend or a holiday
+    while dt.weekday() > 4 or is_market_holiday(dt.date()):
+        dt -= timedelta(days=1)
 
-    # Check if it is a holiday
-    if dt.strftime("%Y-%m-%d") in us_holidays():
-        dt = get_last_time_market_was_open(dt - timedelta(hours=24))
-
-    dt = dt.replace(hour=21, minute=0, second=0)
+    dt = dt.replace(hour=21, minute=0, second=0, microsecond=0)
 
     return dt
 
 
+DF_WRITERS = {
+    "csv": lambda df, path: df.to_csv(path),
+    "json": lambda df, path: df.to_json(path),
+    "xlsx": lambda df, path: df.to_excel(path, index=True, header=True),
+}
+FIGURE_EXTENSIONS = {"png", "jpg", "pdf", "svg"}
+
+
 def export_data(
-    export_type: str, dir_path: str, func_name: str, df: pd.DataFrame = pd.DataFrame()
+    export_type: str,
+    dir_path: str,
+    func_name: str,
+    df: Optional[pd.DataFrame] = None,
 ):
     """Export data to a file.
 
     Parameters
     ----------
     export_type : str
-        Type of export between: csv,json,xlsx,xls
+        Comma separated types of export between: csv,json,xlsx,png,jpg,pdf,svg
     dir_path : str
         Path of directory from where this function is called
     func_name : str
         Name of the command that invokes this function
-    df : pd.Dataframe
-        Dataframe of data to save
+    df : pd.Dataframe, optional
+        Dataframe of data to save, not needed when only exporting figures
     """
     if export_type:
         export_dir = dir_path.replace("gamestonk_terminal", "exports")
@@ -738,51 +943,55 @@ def export_data(
             )
         )
 
-        if "," not in export_type:
-            export_type += ","
-
-        for exp_type in export_type.split(","):
-            if exp_type:
-                saved_path = f"{full_path}.{exp_type}"
-
-                if exp_type == "csv":
-                    df.to_csv(saved_path)
-                elif exp_type == "json":
-                    df.to_json(saved_path)
-                elif exp_type in "xlsx":
-                    df.to_excel(saved_path, index=True, header=True)
-                elif exp_type == "png":
-                    plt.savefig(saved_path)
-                elif exp_type == "jpg":
-                    plt.savefig(saved_path)
-                elif exp_type == "pdf":
-                    plt.savefig(saved_path)
-                elif exp_type == "svg":
-                    plt.savefig(saved_path)
-                else:
-                    print("Wrong export file specified.\n")
-
-                print(f"Saved file: {saved_path}\n")
+        # Remove empty and duplicated export types while keeping their order
+        for exp_type in dict.fromkeys(filter(None, export_type.split(","))):
+            saved_path = f"{full_path}.{exp_type}"
+
+            if exp_type in DF_WRITERS:
+                if df is None:
+                    df = pd.DataFrame()
+                DF_WRITERS[exp_type](df, saved_path)
+            elif exp_type in FIGURE_EXTENSIONS:
+                plt.savefig(saved_path)
+            else:
+                print("Wrong export file specified.\n")
+                continue
+
+            print(f"Saved file: {saved_path}\n")
+
+
+# Seconds the T-Bill rate fetched by get_rf is reused before querying the API again
+RF_CACHE_TTL = 3600
+_RF_CACHE: dict = {"timestamp": 0.0, "rate": None}
+_RF_SESSION = requests.Session()
 
 
 def get_rf() -> float:
     """
-    Uses the fiscaldata.gov API to get most recent T-Bill rate
+    Uses the fiscaldata.gov API to get most recent T-Bill rate.
+    The rate is cached for RF_CACHE_TTL seconds
 
     Returns
     -------
     rate : float
         The current US T-Bill rate
     """
+    if (
+        _RF_CACHE["rate"] is not None
+        and time.monotonic() - _RF_CACHE["timestamp"] < RF_CACHE_TTL
+    ):
+        return _RF_CACHE["rate"]
     try:
         base = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service"
         end = "/v2/accounting/od/avg_interest_rates"
         filters = "?filter=security_desc:eq:Treasury Bills&sort=-record_date"
-        response = requests.get(base + end + filters)
+        response = _RF_SESSION.get(base + end + filters, timeout=5)
         latest = response.json()["data"][0]
-        return round(float(latest["avg_interest_rate_amt"]) / 100, 8)
+        rate = round(float(latest["avg_interest_rate_amt"]) / 100, 8)
     except Exception:
         return 0.02
+    _RF_CACHE.update(timestamp=time.monotonic(), rate=rate)
+    return rate
 
 
 def try_except(f):
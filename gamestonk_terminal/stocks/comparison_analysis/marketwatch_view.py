@@ -9,7 +9,7 @@ from tabulate import tabulate
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
     export_data,
-    financials_colored_values,
+    financials_colored_values_series,
     patch_pandas_text_adjustment,
 )
 from gamestonk_terminal.stocks.comparison_analysis import marketwatch_model
@@ -46,8 +46,8 @@ def display_income_comparison(
     )
 
     if gtff.USE_COLOR:
-        df_financials_compared = df_financials_compared.applymap(
-            financials_colored_values
+        df_financials_compared = df_financials_compared.apply(
+            financials_colored_values_series
         )
         patch_pandas_text_adjustment()
 
@@ -99,8 +99,8 @@ def display_balance_comparison(
     )
 
     if gtff.USE_COLOR:
-        df_financials_compared = df_financials_compared.applymap(
-            financials_colored_values
+        df_financials_compared = df_financials_compared.apply(
+            financials_colored_values_series
         )
         patch_pandas_text_adjustment()
 
@@ -155,8 +155,8 @@ def display_cashflow_comparison(
     )
 
     if gtff.USE_COLOR:
-        df_financials_compared = df_financials_compared.applymap(
-            financials_colored_values
+        df_financials_compared = df_financials_compared.apply(
+            financials_colored_values_series
         )
         patch_pandas_text_adjustment()
 
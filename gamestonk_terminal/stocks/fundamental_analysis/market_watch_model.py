@@ -9,7 +9,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 from gamestonk_terminal.helper_funcs import (
-    clean_data_values_to_float,
+    clean_data_values_to_float_series,
     get_user_agent,
     int_or_round_float,
 )
@@ -242,7 +242,7 @@ def get_sean_seah_warnings(
     )
 
     # Clean these metrics by parsing their values to float
-    df_sean_seah = df_sean_seah.applymap(lambda x: clean_data_values_to_float(x))
+    df_sean_seah = df_sean_seah.apply(clean_data_values_to_float_series)
 
     # Add additional necessary metrics
     series = (
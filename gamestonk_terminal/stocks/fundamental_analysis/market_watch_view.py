@@ -13,7 +13,7 @@ from tabulate import tabulate
 
 from gamestonk_terminal import feature_flags as gtff
 from gamestonk_terminal.helper_funcs import (
-    financials_colored_values,
+    financials_colored_values_series,
     parse_known_args_and_warn,
     patch_pandas_text_adjustment,
     try_except,
@@ -76,7 +76,7 @@ def income(other_args: List[str], ticker: str):
     df_financials = mwm.prepare_df_financials(ticker, "income", ns_parser.b_quarter)
 
     if gtff.USE_COLOR:
-        df_financials = df_financials.applymap(financials_colored_values)
+        df_financials = df_financials.apply(financials_colored_values_series)
 
         patch_pandas_text_adjustment()
         pd.set_option("display.max_colwidth", None)
@@ -153,7 +153,7 @@ def balance(other_args: List[str], ticker: str):
     df_financials = mwm.prepare_df_financials(ticker, "balance", ns_parser.b_quarter)
 
     if gtff.USE_COLOR:
-        df_financials = df_financials.applymap(financials_colored_values)
+        df_financials = df_financials.apply(financials_colored_values_series)
 
         patch_pandas_text_adjustment()
         pd.set_option("display.max_colwidth", None)
@@ -226,7 +226,7 @@ def cash(other_args: List[str], ticker: str):
     df_financials = mwm.prepare_df_financials(ticker, "cashflow", ns_parser.b_quarter)
 
     if gtff.USE_COLOR:
-        df_financials = df_financials.applymap(financials_colored_values)
+        df_financials = df_financials.apply(financials_colored_values_series)
 
         patch_pandas_text_adjustment()
         pd.set_option("display.max_colwidth", None)
@@ -0,0 +1,253 @@
+# IMPORTATION STANDARD
+import argparse
+from datetime import date, datetime
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from gamestonk_terminal import helper_funcs
+
+
+@pytest.mark.parametrize(
+    "last_stock_day, n_next_days, expected",
+    [
+        # Christmas Day 2021 observed on Friday the 24th
+        (
+            datetime(2021, 12, 23),
+            3,
+            [datetime(2021, 12, 27), datetime(2021, 12, 28), datetime(2021, 12, 29)],
+        ),
+        # New Year's Day 2022 falls on a Saturday, markets open on the 31st
+        (
+            datetime(2021, 12, 30, 16),
+            3,
+            [
+                datetime(2021, 12, 31, 16),
+                datetime(2022, 1, 3, 16),
+                datetime(2022, 1, 4, 16),
+            ],
+        ),
+        # Martin Luther King Jr. Day 2023 after a weekend
+        (
+            datetime(2023, 1, 13),
+            2,
+            [datetime(2023, 1, 17), datetime(2023, 1, 18)],
+        ),
+        (datetime(2021, 12, 23), 0, []),
+        # Horizons reaching years without an entry in GOOD_FRIDAYS
+        (
+            datetime(2030, 12, 27),
+            5,
+            [
+                datetime(2030, 12, 30),
+                datetime(2030, 12, 31),
+                datetime(2031, 1, 2),
+                datetime(2031, 1, 3),
+                datetime(2031, 1, 6),
+            ],
+        ),
+        (
+            datetime(2009, 12, 23),
+            3,
+            [datetime(2009, 12, 24), datetime(2009, 12, 28), datetime(2009, 12, 29)],
+        ),
+    ],
+)
+def test_get_next_stock_market_days(last_stock_day, n_next_days, expected):
+    result = helper_funcs.get_next_stock_market_days(last_stock_day, n_next_days)
+    assert result == expected
+
+
+def test_get_next_stock_market_days_timestamp():
+    result = helper_funcs.get_next_stock_market_days(pd.Timestamp("2022-04-14"), 1)
+    # Good Friday is skipped and the input type is kept
+    assert result == [pd.Timestamp("2022-04-18")]
+    assert isinstance(result[0], pd.Timestamp)
+
+
+def test_get_next_stock_market_days_beyond_known_years():
+    result = helper_funcs.get_next_stock_market_days(datetime(2030, 6, 3), 400)
+    assert date(2031, 4, 11) not in [day.date() for day in result]
+    assert not any(helper_funcs.is_market_holiday(day.date()) for day in result)
+
+
+def test_get_next_stock_market_days_long_horizon():
+    result = helper_funcs.get_next_stock_market_days(datetime(2021, 1, 1), 252)
+    assert len(result) == 252
+    assert all(day.weekday() < 5 for day in result)
+    assert not any(helper_funcs.is_market_holiday(day.date()) for day in result)
+    assert result == sorted(set(result))
+
+
+@pytest.mark.parametrize(
+    "day, expected",
+    [
+        (date(2021, 12, 24), True),
+        (date(2022, 4, 15), True),
+        (date(2023, 1, 2), True),
+        (date(2021, 12, 31), False),
+        (date(2022, 4, 14), False),
+        # Years without an entry in GOOD_FRIDAYS
+        (date(2009, 12, 25), True),
+        (date(2031, 1, 1), True),
+        (date(2031, 4, 11), True),
+        (date(2031, 4, 10), False),
+    ],
+)
+def test_is_market_holiday(day, expected):
+    assert helper_funcs.is_market_holiday(day) == expected
+
+
+@pytest.mark.parametrize(
+    "year, good_friday",
+    [(2021, date(2021, 4, 2)), (2009, date(2009, 4, 10)), (2031, date(2031, 4, 11))],
+)
+def test_us_market_holidays_good_friday(year, good_friday):
+    assert good_friday in helper_funcs.us_market_holidays(year)
+
+
+def test_all_market_holidays():
+    holidays = set()
+    for year in helper_funcs.GOOD_FRIDAYS:
+        holidays.update(helper_funcs.us_market_holidays(year))
+    assert helper_funcs.all_market_holidays() == holidays
+
+
+@pytest.mark.parametrize(
+    "dt, expected",
+    [
+        (datetime(2021, 12, 27, 10, 5, 3, 44), datetime(2021, 12, 27, 21)),
+        (datetime(2022, 1, 2), datetime(2021, 12, 31, 21)),
+        (datetime(2021, 1, 18, 3), datetime(2021, 1, 15, 21)),
+        (datetime(2021, 4, 4), datetime(2021, 4, 1, 21)),
+        # Years without an entry in GOOD_FRIDAYS
+        (datetime(2009, 12, 25, 10), datetime(2009, 12, 24, 21)),
+        (datetime(2031, 1, 1, 10), datetime(2030, 12, 31, 21)),
+        (datetime(2031, 4, 13), datetime(2031, 4, 10, 21)),
+    ],
+)
+def test_get_last_time_market_was_open(dt, expected):
+    assert helper_funcs.get_last_time_market_was_open(dt) == expected
+
+
+@pytest.mark.parametrize(
+    "s_date, expected",
+    [
+        ("2021-03-04", datetime(2021, 3, 4)),
+        ("2021-3-4", datetime(2021, 3, 4)),
+    ],
+)
+def test_valid_date(s_date, expected):
+    assert helper_funcs.valid_date(s_date) == expected
+
+
+@pytest.mark.parametrize(
+    "s_date",
+    ["2021-+1-01", "2021-1 -01", "2021/03/04", "2021-02-30", "2021-03-04x", "abc"],
+)
+def test_valid_date_invalid(s_date):
+    with pytest.raises(argparse.ArgumentTypeError):
+        helper_funcs.valid_date(s_date)
+
+
+def test_divide_chunks_sliceable():
+    assert list(helper_funcs.divide_chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(helper_funcs.divide_chunks("abcde", 2)) == ["ab", "cd", "e"]
+
+    chunks = list(helper_funcs.divide_chunks(np.arange(5), 2))
+    assert [chunk.tolist() for chunk in chunks] == [[0, 1], [2, 3], [4]]
+
+
+def test_divide_chunks_pandas():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    chunks = list(helper_funcs.divide_chunks(df, 2))
+    pd.testing.assert_frame_equal(chunks[0], df.iloc[:2])
+    pd.testing.assert_frame_equal(chunks[1], df.iloc[2:])
+
+    series = pd.Series([1, 2, 3])
+    chunks = list(helper_funcs.divide_chunks(series, 2))
+    pd.testing.assert_series_equal(chunks[0], series.iloc[:2])
+    pd.testing.assert_series_equal(chunks[1], series.iloc[2:])
+
+
+def test_divide_chunks_iterator():
+    chunks = helper_funcs.divide_chunks(iter(range(5)), 2)
+    assert list(chunks) == [[0, 1], [2, 3], [4]]
+
+
+CLEAN_VALUES = ["(1.5B)", "2.3M", "-", "12%", "(4K)", " 7 ", "-3.2%", "0.5"]
+
+
+def test_clean_data_values_to_float_series():
+    result = helper_funcs.clean_data_values_to_float_series(pd.Series(CLEAN_VALUES))
+    expected = [helper_funcs.clean_data_values_to_float(val) for val in CLEAN_VALUES]
+    np.testing.assert_allclose(result.to_numpy(), expected)
+
+
+def test_clean_data_values_to_float_series_invalid():
+    result = helper_funcs.clean_data_values_to_float_series(pd.Series(["abc", "1B"]))
+    assert np.isnan(result[0])
+    assert result[1] == 1_000_000_000
+
+
+COLORED_VALUES = [
+    "N/A",
+    np.nan,
+    "nan",
+    "12.5%",
+    "-3.2%",
+    "(1.2B)",
+    "4.5M",
+    "-",
+    "Net Income",
+    "(Some text)",
+    "a1%",
+    "-1.0",
+]
+
+
+def test_financials_colored_values_series():
+    result = helper_funcs.financials_colored_values_series(
+        pd.Series(COLORED_VALUES, dtype=object)
+    )
+    expected = [helper_funcs.financials_colored_values(val) for val in COLORED_VALUES]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "export_type, expected",
+    [
+        ("csv", ["csv"]),
+        ("csv,json,csv,,", ["csv", "json"]),
+        ("png,svg", ["png", "svg"]),
+        ("csv,foo", ["csv"]),
+    ],
+)
+def test_export_data(export_type, expected, tmp_path, mocker):
+    mocker.patch(target="gamestonk_terminal.helper_funcs.plt.savefig")
+    df = pd.DataFrame({"a": [1, 2]})
+    dir_path = str(tmp_path / "gamestonk_terminal")
+    (tmp_path / "exports").mkdir()
+
+    helper_funcs.export_data(export_type, dir_path, "test", df)
+
+    saved = sorted(path.suffix[1:] for path in (tmp_path / "exports").iterdir())
+    figures = [
+        call.args[0].rsplit(".", 1)[1]
+        for call in helper_funcs.plt.savefig.call_args_list
+    ]
+    assert sorted(saved + figures) == sorted(expected)
+
+
+def test_export_data_figures_only(tmp_path, mocker):
+    mocker.patch(target="gamestonk_terminal.helper_funcs.plt.savefig")
+    mock_df = mocker.patch(target="gamestonk_terminal.helper_funcs.pd.DataFrame")
+    dir_path = str(tmp_path / "gamestonk_terminal")
+
+    helper_funcs.export_data("png,pdf", dir_path, "test")
+
+    assert helper_funcs.plt.savefig.call_count == 2
+    mock_df.assert_not_called()